@@ -1,12 +1,71 @@
 
 from __future__ import annotations
 import asyncio
+import functools
+import logging
+import random
+import sys
 import time
+from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+try:
+    import aiodns  # optional, enables aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 from log import create_logger  # Project logger factory
 
 BASE_URL = "https://api.cloudflare.com/client/v4/"
+RATE_WINDOW = 60.0  # seconds covered by rpm_limit
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Failures where the request never reached Cloudflare, so even a POST is safe to re-send
+# (ConnectionTimeoutError only exists in aiohttp >= 3.10)
+NOT_SENT_ERRORS = (aiohttp.ClientConnectorError,) + (
+    (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+)
+RETRY_BASE = 0.5    # seconds, first backoff step
+RETRY_CAP = 30.0    # seconds, longest backoff step
+ZONES_PER_PAGE = 50 # maximum page size of GET /zones
+ZONE_META_TTL = 300.0  # seconds a cached zone payload stays fresh
+
+
+@functools.lru_cache(maxsize=256)
+def _join_url(path: str) -> str:
+    return f"{BASE_URL}{path.lstrip('/')}"
+
+
+class _SharedSession:
+    """One HTTP session plus the throttling state for one set of credentials.
+
+    Cloudflare's quota is per user, so every client sharing the session also shares the
+    sliding window, the Retry-After pause and the AIMD concurrency limit. Limits come from
+    the client that opened the session.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, resolver: Optional[aiohttp.AsyncResolver],
+                 max_concurrency: int, rpm_limit: int):
+        self.session = session
+        self.resolver = resolver  # passed in explicitly, so the connector won't close it
+        self.refs = 0
+        self.max_concurrency = max_concurrency
+        self.rpm_limit = rpm_limit
+        # AIMD-controlled in-flight limit: +0.5 per success, halved on 429/5xx
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.slot_waiters: List[asyncio.Future] = []
+        self.sent_at: deque[float] = deque()
+        self.paused_until = 0.0
+
+
+# Sessions shared between CloudflareAsyncAPI instances, refcounted by __aenter__/__aexit__
+_SESSION_CACHE: Dict[tuple, _SharedSession] = {}
 
 
 class CloudflareAsyncAPI:
@@ -14,16 +73,17 @@ class CloudflareAsyncAPI:
 
     # ---------------- Factories ---------------- #
     @classmethod
-    def from_api_token(cls, token: str, *, timeout: int = 10, verify_token_on_enter: bool = True):
-        return cls(token=token, timeout=timeout, verify_token_on_enter=verify_token_on_enter)
+    def from_api_token(cls, token: str, *, timeout: int = 10, verify_token_on_enter: bool = True, **kwargs):
+        return cls(token=token, timeout=timeout, verify_token_on_enter=verify_token_on_enter, **kwargs)
 
     @classmethod
-    def from_global_key(cls, email: str, api_key: str, *, timeout: int = 10):
-        return cls(global_email=email, global_key=api_key, timeout=timeout, verify_token_on_enter=True)
+    def from_global_key(cls, email: str, api_key: str, *, timeout: int = 10, **kwargs):
+        return cls(global_email=email, global_key=api_key, timeout=timeout, verify_token_on_enter=True, **kwargs)
 
     # ---------------- init ------------------- #
     def __init__(self, *, token: str | None = None, global_email: str | None = None, global_key: str | None = None,
-                 timeout: int = 10, verify_token_on_enter: bool = True, msg2edit: bool = True):
+                 timeout: int = 10, verify_token_on_enter: bool = True, msg2edit: bool = True,
+                 max_concurrency: int = 32, rpm_limit: int = 240, max_retries: int = 4):
         # Logger is now unique for each instance
         self._logger = create_logger(__name__, "CloudFlare-API")
         if token and (global_email or global_key):
@@ -34,10 +94,26 @@ class CloudflareAsyncAPI:
         self._token = token
         self._g_email = global_email
         self._g_key = global_key
+        headers = CIMultiDict({"Content-Type": "application/json"})
+        if self._auth_type == "token":
+            headers["Authorization"] = f"Bearer {self._token}"
+        else:
+            headers.update({"X-Auth-Email": self._g_email or "", "X-Auth-Key": self._g_key or ""})
+        self._headers = CIMultiDictProxy(headers)  # built once, read-only
         self._timeout_cfg = aiohttp.ClientTimeout(total=timeout)
         self._verify_on_enter = verify_token_on_enter
         self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
         self._cached_account_id: Optional[str] = None
+        self._cached_user: Optional[dict] = None
+        self._user_lock: Optional[asyncio.Lock] = None
+        self._zone_meta_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # zone_id -> (fetched_at, zone)
+        self._zone_ids: Dict[str, str] = {}  # name -> zone_id; freshness comes from _zone_meta_cache
+        # Client-side throttling (Cloudflare allows 1200 requests / 5 min per user)
+        self._max_concurrency = max_concurrency
+        self._rpm_limit = rpm_limit
+        self._max_retries = max_retries
+        self._shared: Optional[_SharedSession] = None
 
     # ------------ Exceptions ------------ #
     @staticmethod
@@ -61,71 +137,226 @@ class CloudflareAsyncAPI:
 
     # ---------------- context ------------ #
     async def __aenter__(self):
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self._auth_type == "token":
-            headers["Authorization"] = f"Bearer {self._token}"
-        else:
-            headers.update({"X-Auth-Email": self._g_email or "", "X-Auth-Key": self._g_key or ""})
-        self._session = aiohttp.ClientSession(headers=headers, timeout=self._timeout_cfg)
-        self._logger.info("HTTP session opened (auth=%s)", self._auth_type)
+        key = self._session_key()
+        # No await between lookup and refcount bump, so this is atomic on the loop without a lock
+        shared = _SESSION_CACHE.get(key)
+        if shared is None or shared.session.closed:
+            # All traffic goes to a single host, so keep a warm per-host pool and cache DNS lookups
+            resolver = aiohttp.AsyncResolver() if aiodns else None
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                resolver=resolver,
+                keepalive_timeout=75,
+            )
+            session = aiohttp.ClientSession(headers=self._headers, timeout=self._timeout_cfg, connector=connector)
+            shared = _SharedSession(session, resolver, self._max_concurrency, self._rpm_limit)
+            _SESSION_CACHE[key] = shared
+            self._logger.info("HTTP session opened (auth=%s)", self._auth_type)
+        shared.refs += 1
+        self._shared = shared
+        self._session = shared.session
+        self._connector = shared.session.connector
+        # asyncio primitives bind to the loop that first waits on them, so make fresh ones per entry
+        self._user_lock = asyncio.Lock()
         if self._verify_on_enter:
-            await self._verify_auth()
+            try:
+                await self._verify_auth()
+            except BaseException:
+                # `async with` skips __aexit__ when __aenter__ raises, so release the session here
+                await self.__aexit__(*sys.exc_info())
+                raise
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._shared is None:
+            return
+        key = self._session_key()
+        shared, connector = self._shared, self._connector
+        self._shared = None
+        self._session = None
+        self._connector = None
+        # Unregister before awaiting so a concurrent __aenter__ opens a fresh session instead
+        shared.refs -= 1
+        if shared.refs > 0:
+            return
+        if _SESSION_CACHE.get(key) is shared:
+            del _SESSION_CACHE[key]
+        if not shared.session.closed:
+            await shared.session.close()
             self._logger.info("HTTP session closed")
+        if connector and not connector.closed:
+            await connector.close()
+        if shared.resolver is not None:
+            await shared.resolver.close()
+
+    def _session_key(self) -> tuple:
+        """Instances with the same credentials on the same loop share one session (and its warm TLS pool)."""
+        loop = asyncio.get_running_loop()
+        if self._auth_type == "token":
+            return loop, self._auth_type, self._token
+        return loop, self._auth_type, self._g_email, self._g_key
 
     # ---------------- low-level ------------- #
     async def _request(self, method: str, path: str, *, expect_success: bool = True, **kwargs):
-        if not self._session:
+        if not self._shared:
             raise RuntimeError("Session not started")
-        url = f"{BASE_URL}{path.lstrip('/')}"
+        url = _join_url(path)
         self._logger.debug("→ %s %s", method.upper(), url)
-        async with self._session.request(method, url, **kwargs) as resp:
-            data: Dict[str, Any] = await resp.json(content_type=None)
-            self._logger.debug("← HTTP %s JSON: %s", resp.status, data)
-            if expect_success and not data.get("success", False):
-                for err in data.get("errors", []):
-                    code = err.get("code")
-                    if code in (1061, 10006):
-                        raise self.ZoneAlreadyExists(err.get("message", "Zone already exists"))
-                    if code in (6003, 6103) or any(chain.get("code") == 6111 for chain in err.get("error_chain") or []):
-                        raise self.InvalidRequestHeaders(err.get("message", "Invalid request headers"))
-                    if code == 81058:
-                        raise self.IdenticalRecoedExists(err.get("message", "An identical record already exists."))
-                    if code == 9002:
-                        raise self.DNSRecordInvalid(err.get("message", "DNS record type is invalid."))
-                    if code == 1118:
-                        raise self.ExceededZonesLimit(err.get("message", "Account has exceeded the limit for adding zones"))
-                raise RuntimeError(f"Cloudflare error: {data.get('errors')}")
-            return data.get("result", data)
+        status, data = await self._send_with_retry(method, url, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("← HTTP %s JSON: %s", status, data)
+        if expect_success and not data.get("success", False):
+            errors = data.get("errors") or []
+            for err in errors:
+                exc_cls, default_msg = _ERROR_MAP.get(err.get("code"), (None, None))
+                if exc_cls:
+                    raise exc_cls(err.get("message") or default_msg)
+                if any(chain.get("code") == 6111 for chain in err.get("error_chain") or []):
+                    raise self.InvalidRequestHeaders(err.get("message") or "Invalid request headers")
+            if errors:
+                raise RuntimeError(f"Cloudflare error: {errors}")
+            raise RuntimeError(f"Cloudflare request failed (HTTP {status})")
+        return data.get("result", data)
+
+    async def _send_with_retry(self, method: str, url: str, **kwargs) -> Tuple[int, Dict[str, Any]]:
+        """Send a request, retrying transient failures with jittered exponential backoff.
+
+        GETs are retried on any transient failure; other methods only on 429 or when the
+        connection was never established.
+        """
+        shared = self._shared
+        for attempt in range(self._max_retries + 1):
+            status, retry_after, error = None, None, None
+            await self._acquire_slot()
+            try:
+                await self._wait_if_throttled()
+                async with self._session.request(method, url, timeout=self._timeout_cfg, **kwargs) as resp:
+                    status = resp.status
+                    retry_after = resp.headers.get("Retry-After")
+                    self._note_rate_limit(resp.headers)
+                    if status not in RETRY_STATUSES:
+                        raw = await resp.read()
+                        data: Dict[str, Any] = _loads(raw)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            finally:
+                self._release_slot(shared)
+
+            if error is None and status not in RETRY_STATUSES:
+                shared.concurrency = min(float(shared.max_concurrency), shared.concurrency + 0.5)
+                return status, data
+            shared.concurrency = max(1.0, shared.concurrency * 0.5)
+            # Only GETs are idempotent here; a POST that may have been processed must not be re-sent
+            resend_safe = method.upper() == "GET" or status == 429 or isinstance(error, NOT_SENT_ERRORS)
+            if attempt == self._max_retries or not resend_safe:
+                if error is not None:
+                    raise error
+                raise RuntimeError(f"Cloudflare request failed (HTTP {status})")
+            try:
+                delay = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                delay = None
+            if delay is None:
+                delay = min(RETRY_CAP, RETRY_BASE * 2 ** attempt + random.random())
+            self._logger.warning("%s %s failed (%s), retry %s/%s in %.2fs",
+                                 method.upper(), url, error or f"HTTP {status}", attempt + 1, self._max_retries, delay)
+            await asyncio.sleep(delay)
+
+    async def _acquire_slot(self):
+        shared = self._shared
+        while shared.in_flight >= int(shared.concurrency):
+            waiter = asyncio.get_running_loop().create_future()
+            shared.slot_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in shared.slot_waiters:
+                    shared.slot_waiters.remove(waiter)
+        shared.in_flight += 1
+
+    def _release_slot(self, shared: _SharedSession):
+        # Synchronous on purpose: a cancelled task can't be interrupted half-way and leak the slot.
+        # Every waiter re-checks the limit, so a cancelled waiter never swallows a wake-up.
+        shared.in_flight -= 1
+        waiters, shared.slot_waiters = shared.slot_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _wait_if_throttled(self):
+        """Sliding-window limiter: block until a slot is free in the last RATE_WINDOW seconds."""
+        shared = self._shared
+        while True:
+            now = time.monotonic()
+            if shared.paused_until > now:
+                await asyncio.sleep(shared.paused_until - now)
+                continue
+            while shared.sent_at and now - shared.sent_at[0] >= RATE_WINDOW:
+                shared.sent_at.popleft()
+            if len(shared.sent_at) < shared.rpm_limit:
+                shared.sent_at.append(now)
+                return
+            window_end = shared.sent_at[0] + RATE_WINDOW
+            self._logger.debug("Rate limit window full, sleeping %.2fs", window_end - now)
+            await asyncio.sleep(window_end - now)
+
+    def _note_rate_limit(self, headers):
+        """Pause preemptively when Cloudflare reports the quota is (almost) used up."""
+        shared = self._shared
+        delay = 0.0
+        if (retry_after := headers.get("Retry-After")) is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        elif (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+            try:
+                limit = int(headers.get("X-RateLimit-Limit", shared.rpm_limit))
+                if int(remaining) < limit * 0.1:
+                    delay = RATE_WINDOW / shared.rpm_limit
+            except ValueError:
+                pass
+        if delay > 0:
+            shared.paused_until = max(shared.paused_until, time.monotonic() + delay)
+            self._logger.warning("Cloudflare rate limit nearly exhausted, pausing for %.2fs", delay)
 
     async def _verify_auth(self):
         if self._auth_type == "token":
             res = await self._request("GET", "user/tokens/verify", expect_success=False)
             self._logger.info("API token is valid (user=%s)", res.get("result", {}).get("id"))
         else:
-            user = await self._request("GET", "user", expect_success=False)
-            if user is None: raise self.UserCredsInvalid("Email or GlobalKey are invalid")
+            user = await self._fetch_user()
             self._logger.info("Global API Key is valid (user=%s)", user.get("id"))
 
+    async def _fetch_user(self) -> dict:
+        """GET user once per instance; concurrent first callers share the same round trip."""
+        if self._cached_user is not None:
+            return self._cached_user
+        async with self._user_lock:
+            if self._cached_user is None:
+                user = await self._request("GET", "user", expect_success=False)
+                if user is None: raise self.UserCredsInvalid("Email or GlobalKey are invalid")
+                self._cached_user = user
+                if user.get("account"):
+                    self._cached_account_id = user["account"].get("id")
+                elif user.get("accounts"):
+                    self._cached_account_id = user["accounts"][0]["id"]
+        return self._cached_user
+
     # ---------- helpers ---------- #
     async def _default_account_id(self) -> Optional[str]:
         if self._cached_account_id:
             return self._cached_account_id
-        user = await self._request("GET", "user", expect_success=False)
-        if user is None: raise self.UserCredsInvalid("Email or GlobalKey are invalid")
+        await self._fetch_user()
+        if self._cached_account_id:
+            return self._cached_account_id
         acc_id = None
-        if user.get("account"):
-            acc_id = user["account"].get("id")
-        elif user.get("accounts"):
-            acc_id = user["accounts"][0]["id"]
-        else:
-            accounts = await self._request("GET", "accounts")
-            if accounts:
-                acc_id = accounts[0]["id"]
+        accounts = await self._request("GET", "accounts")
+        if accounts:
+            acc_id = accounts[0]["id"]
         self._cached_account_id = acc_id
         return acc_id
 
@@ -134,40 +365,147 @@ class CloudflareAsyncAPI:
         payload: Dict[str, Any] = {"name": name, "jump_start": jump_start, "type": zone_type}
         if (acc_id := await self._default_account_id()):
             payload["account"] = {"id": acc_id}
-        self._logger.info("Creating zone {}…".format(name))
+        self._logger.info("Creating zone %s…", name)
         return await self._request("POST", "zones", json=payload)
 
     async def register_domain(self, name: str, *, fail_if_exists: bool = False, **kwargs) -> Tuple[str, str, str]:
-        try:
+        if fail_if_exists:
             zone = await self.create_zone(name, **kwargs)
-        except self.ZoneAlreadyExists:
-            if fail_if_exists:
-                raise
-            self._logger.info("Zone {} already exists — retrieving ID".format(name))
-            zone = (await self._request("GET", "zones", params={"name": name}))[0]
+        else:
+            zone_id = self._zone_ids.get(name)
+            cached = self._cached_zone(zone_id) if zone_id else None
+            if cached and len(ns := cached.get("name_servers") or []) >= 2:
+                return cached["id"], ns[0], ns[1]
+            existing = await self._request("GET", "zones", params={"name": name})
+            if existing:
+                self._logger.info("Zone %s already exists — reusing ID", name)
+                zone = existing[0]
+            else:
+                zone = await self.create_zone(name, **kwargs)
         ns = zone.get("name_servers", [])
         if len(ns) < 2:
             raise RuntimeError("Cloudflare did not return two NS servers")
+        self._remember_zone(zone)
         return zone["id"], ns[0], ns[1]
 
     # ---------- DNS --------------- #
     async def add_dns_record(self, zone_id: str, record_type: str, name: str, content: str, *, ttl: int = 1, **extra):
         payload = {"type": record_type.upper(), "name": name, "content": content, "ttl": ttl, **extra}
-        self._logger.info("Adding record {} {} → {}".format(record_type.upper(), name, content))
+        self._logger.info("Adding record %s %s → %s", record_type.upper(), name, content)
         return await self._request("POST", f"zones/{zone_id}/dns_records", json=payload)
 
+    async def bulk_add_dns_records(self, zone_id: str, records: List[Dict[str, Any]]) -> List[Any]:
+        """Add many records concurrently; results keep input order, failures are returned as exceptions."""
+        coros = [self.add_dns_record(zone_id, **r) for r in records]
+        return await asyncio.gather(*coros, return_exceptions=True)
+
     # ---------- status ------------ #
+    async def get_zone(self, zone_id: str, *, max_age: float = ZONE_META_TTL) -> Dict[str, Any]:
+        """Zone metadata, served from the instance cache when it is younger than ``max_age`` seconds."""
+        if (cached := self._cached_zone(zone_id, max_age)) is not None:
+            return cached
+        zone = await self._request("GET", f"zones/{zone_id}")
+        self._remember_zone(zone)
+        return zone
+
+    def _cached_zone(self, zone_id: str, max_age: float = ZONE_META_TTL) -> Optional[Dict[str, Any]]:
+        """Cached zone payload if younger than ``max_age``; stale entries are evicted."""
+        cached = self._zone_meta_cache.get(zone_id)
+        if cached is None:
+            return None
+        fetched_at, zone = cached
+        if time.monotonic() - fetched_at < max_age:
+            return zone
+        del self._zone_meta_cache[zone_id]
+        if self._zone_ids.get(zone.get("name")) == zone_id:
+            del self._zone_ids[zone["name"]]
+        return None
+
+    def _remember_zone(self, zone: Dict[str, Any]):
+        self._zone_meta_cache[zone["id"]] = (time.monotonic(), zone)
+        if zone.get("name"):
+            self._zone_ids[zone["name"]] = zone["id"]
+
     async def zone_status(self, zone_id: str) -> str:
-        return (await self._request("GET", f"zones/{zone_id}"))["status"]
+        # Status is what callers poll for, so always read it fresh
+        return (await self.get_zone(zone_id, max_age=0))["status"]
+
+    async def zone_statuses(self, zone_ids: List[str]) -> Dict[str, str]:
+        """Statuses of several zones, read from the paginated zone list instead of one GET per zone."""
+        return await self._zone_statuses(zone_ids, set())
+
+    async def _zone_statuses(self, zone_ids: List[str], direct: set) -> Dict[str, str]:
+        """Scan at most as many list pages as there are zones to find, so the scan never costs more
+        than one GET per zone. Ids the scan misses are moved into ``direct`` and fetched one by one."""
+        paged = set(zone_ids) - direct
+        statuses: Dict[str, str] = {}
+        page = 1
+        while paged - statuses.keys() and page <= len(paged):
+            zones = await self._request("GET", "zones", params={"per_page": ZONES_PER_PAGE, "page": page})
+            for zone in zones:
+                if zone["id"] in paged:
+                    statuses[zone["id"]] = zone["status"]
+                    self._remember_zone(zone)
+            if len(zones) < ZONES_PER_PAGE:
+                break
+            page += 1
+        direct |= paged - statuses.keys()
+        missing = [z for z in zone_ids if z in direct]
+        if missing:
+            statuses.update(zip(missing, await asyncio.gather(*(self.zone_status(z) for z in missing))))
+        return statuses
 
     async def wait_until_active(self, zone_id: str, *, interval: int = 15, timeout: int = 1800):
-        self._logger.info("Waiting for zone {} to become active".format(zone_id))
-        start = time.monotonic()
+        self._logger.info("Waiting for zone %s to become active", zone_id)
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                await self._poll_until_active(zone_id, interval)
+        except TimeoutError:
+            # HTTP timeouts inside the poll are TimeoutErrors too; only rename the deadline
+            if deadline.expired():
+                raise TimeoutError("Zone activation timed out") from None
+            raise
+
+    async def _poll_until_active(self, zone_id: str, interval: int):
+        delay = 2.0
+        while await self.zone_status(zone_id) != "active":
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(interval, delay * 1.5)
+        self._logger.info("Zone %s is active", zone_id)
+
+    async def wait_until_active_many(self, zone_ids: List[str], *, interval: int = 15, timeout: int = 1800):
+        pending = set(zone_ids)
+        self._logger.info("Waiting for %s zones to become active", len(pending))
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                await self._poll_until_active_many(pending, interval)
+        except TimeoutError:
+            if deadline.expired():
+                raise TimeoutError("Zone activation timed out: {}".format(", ".join(sorted(pending)))) from None
+            raise
+
+    async def _poll_until_active_many(self, pending: set, interval: int):
+        """Discards zones from ``pending`` as they activate, so the caller can report what is left."""
+        delay = 2.0
+        direct: set = set()  # zones the paged scan could not find cheaply
         while True:
-            if await self.zone_status(zone_id) == "active":
-                self._logger.info("Zone {} is active".format(zone_id))
+            statuses = await self._zone_statuses(list(pending), direct)
+            for zone_id in [z for z in pending if statuses.get(z) == "active"]:
+                self._logger.info("Zone %s is active", zone_id)
+                pending.discard(zone_id)
+            if not pending:
                 return
-            if time.monotonic() - start > timeout:
-                raise TimeoutError("Zone activation timed out")
-            await asyncio.sleep(interval)
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(interval, delay * 1.5)
+
 
+# Cloudflare error code -> (exception, fallback message) used by CloudflareAsyncAPI._request
+_ERROR_MAP: Dict[int, Tuple[type, str]] = {
+    1061:  (CloudflareAsyncAPI.ZoneAlreadyExists, "Zone already exists"),
+    10006: (CloudflareAsyncAPI.ZoneAlreadyExists, "Zone already exists"),
+    6003:  (CloudflareAsyncAPI.InvalidRequestHeaders, "Invalid request headers"),
+    6103:  (CloudflareAsyncAPI.InvalidRequestHeaders, "Invalid request headers"),
+    81058: (CloudflareAsyncAPI.IdenticalRecoedExists, "An identical record already exists."),
+    9002:  (CloudflareAsyncAPI.DNSRecordInvalid, "DNS record type is invalid."),
+    1118:  (CloudflareAsyncAPI.ExceededZonesLimit, "Account has exceeded the limit for adding zones"),
+}
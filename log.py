@@ -1,4 +1,8 @@
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 from colorama import Fore, Style, init
 
 init(autoreset=True)
@@ -19,12 +23,10 @@ class ColorFormatter(logging.Formatter):
         original_levelname = record.levelname
         original_name = record.name
 
-        padded_level = original_levelname.center(self.LEVEL_WIDTH)
-        record.name = original_name.center(self.NAME_WIDTH)
-
-        color = LEVEL_COLORS.get(record.levelno, "")
-        record.levelname = f"{color}{padded_level}{Style.RESET_ALL}"
+        record.levelname = _LEVEL_CACHE.get(record.levelno) or original_levelname.center(self.LEVEL_WIDTH)
+        record.name = _pad_name(original_name, self.NAME_WIDTH)
 
+        # Records are shared with the plain file handler, so the colored fields must not leak
         try:
             return super().format(record)
         finally:
@@ -32,28 +34,72 @@ class ColorFormatter(logging.Formatter):
             record.name = original_name
 
 
-def create_logger(name: str = __name__, prefix: str = None, level: int = logging.INFO) -> logging.Logger:
-    fmt = "%(asctime)s | %(name)s | %(levelname)s | [{}] %(message)s".format(prefix)
-    datefmt = "%Y-%m-%d %H:%M:%S"
+# Colored, padded level names are known up front; logger names are few and repeat
+_LEVEL_CACHE = {
+    lvl: f"{color}{logging.getLevelName(lvl).center(ColorFormatter.LEVEL_WIDTH)}{Style.RESET_ALL}"
+    for lvl, color in LEVEL_COLORS.items()
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _pad_name(name: str, width: int) -> str:
+    return name.center(width)
+
+
+# File writes happen on a background thread; loggers only enqueue already-formatted records
+# (app.log is opened on first write; the thread starts once create_logger installs the QueueHandler)
+_log_queue = queue.SimpleQueue()
+_file_handler = logging.FileHandler("app.log", encoding="utf-8", delay=True)
+_file_handler.setFormatter(logging.Formatter("%(message)s"))
+_listener = logging.handlers.QueueListener(_log_queue, _file_handler, respect_handler_level=True)
+_listener_started = False
+
+
+def _start_listener():
+    global _listener_started
+    if not _listener_started:
+        _listener.start()
+        atexit.register(_listener.stop)
+        _listener_started = True
+
 
-    console = logging.StreamHandler()
-    console.setFormatter(ColorFormatter(fmt, datefmt=datefmt))
+class PrefixFilter(logging.Filter):
+    """Gives ``record.prefix`` a default for records that did not come through a prefixed adapter."""
 
-    file_ = logging.FileHandler("app.log", encoding="utf-8")
-    file_.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
+    def __init__(self, prefix: str = None):
+        super().__init__()
+        self.prefix = prefix
 
+    def filter(self, record):
+        if not hasattr(record, "prefix"):
+            record.prefix = self.prefix
+        return True
+
+
+FMT = "%(asctime)s | %(name)s | %(levelname)s | [%(prefix)s] %(message)s"
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+def create_logger(name: str = __name__, prefix: str = None, level: int = logging.INFO) -> logging.LoggerAdapter:
     root = logging.getLogger()
     if not root.handlers:           
         root.setLevel(level)
-        root.addHandler(console)
-        root.addHandler(file_)
+
+        console = logging.StreamHandler()
+        console.setFormatter(ColorFormatter(FMT, datefmt=DATEFMT))
+
+        file_ = logging.handlers.QueueHandler(_log_queue)
+        file_.setFormatter(logging.Formatter(FMT, datefmt=DATEFMT))
+        _start_listener()
+
+        # Records from third-party loggers carry no prefix of their own
+        for handler in (console, file_):
+            handler.addFilter(PrefixFilter())
+            root.addHandler(handler)
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = True
 
-    if not logger.handlers:         
-        logger.addHandler(console)
-        logger.addHandler(file_)
-
-    logger.propagate = False        
-    return logger
+    # The prefix travels on each record via ``extra``, so every prefix shares the root handlers
+    return logging.LoggerAdapter(logger, {"prefix": prefix})